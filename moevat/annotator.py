@@ -1,5 +1,9 @@
-import glob, csv, os, typing
+import csv, os, typing
+import math
 import logging
+import random
+import threading
+import time
 import shutil
 import json
 import cv2
@@ -126,17 +130,46 @@ def overlay_text(image, text, pos, font_color=(255, 255, 255)):
 
     cv2.putText(image, text, pos, font, font_scale, font_color, font_thickness)
 
-def write_results(output_name: str, labels_dict: typing.Dict, measure: bool=False):
+def show_message(title: str, delay: int) -> int:
+    # Show a message in the labeling window and wait for a keystroke up to `delay` milliseconds...
+    message = np.ones((50, 900, 3))
+    cv2.putText(message, title, (7, 25), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0,100,0), 2, 1)
+    cv2.imshow("Moevat", message)
+    return cv2.waitKeyEx(delay)
+
+def write_results(output_name: str, labels_dict: typing.Dict, measure: bool=False, reviews: bool=False):
+    # Write to a temporary file and swap it in, so an interrupted write never wipes existing labels...
+    tmp_name = f"{output_name}.tmp"
     if os.path.splitext(output_name)[-1].lower() == '.csv' and not measure:
         header = ['image_name', 'label', 'class']
-        with open(output_name, newline='', mode='w') as of:
+        # Prediction reviews carry extra columns...
+        if reviews:
+            header += ['prediction', 'confidence', 'review']
+        with open(tmp_name, newline='', mode='w') as of:
             writer = csv.DictWriter(of, fieldnames=header)
             writer.writeheader()
             for value in labels_dict.values():
                 writer.writerow(value)
     else:
-        with open(output_name, mode='w') as of:
+        with open(tmp_name, mode='w') as of:
             json.dump(labels_dict, of, separators=[',', ':'], indent=4)
+    os.replace(tmp_name, output_name)
+
+def append_result(output_name: str, record: typing.Dict) -> bool:
+    """
+        Append a single label to an existing csv labels file. Returns False when the record can't be appended
+        (json output, missing file or header without the record's columns) and the file has to be rewritten.
+        Relabeled images end up with several rows, the last one wins when loading existing labels.
+    """
+    if os.path.splitext(output_name)[-1].lower() != '.csv' or not os.path.isfile(output_name):
+        return False
+    with open(output_name, newline='') as f:
+        header = next(csv.reader(f), None)
+    if not header or not set(record) <= set(header):
+        return False
+    with open(output_name, newline='', mode='a') as of:
+        csv.DictWriter(of, fieldnames=header).writerow(record)
+    return True
 
 def load_existing_labels(output_name: str) -> typing.Dict:
     existing_labels = {}
@@ -157,9 +190,195 @@ def load_existing_labels(output_name: str) -> typing.Dict:
             existing_labels_dict[image_name] = _dict
     return existing_labels_dict
 
+def discover_items(images_path: str, supported_formats: typing.Set, existing_labels_dict: typing.Dict,
+                   items: typing.List, discovery: threading.Condition, done: threading.Event,
+                   watch_interval: float=None, ignore_dirs: typing.Set=frozenset(), requeue: typing.List=None):
+    """
+        Walk `images_path` with os.scandir and append unlabeled images of supported formats to `items`
+        as soon as they are found, notifying `discovery` on every new item. Hidden entries are skipped
+        like glob does. `done` is set once the whole tree has been walked.
+
+        If `watch_interval` is given, keep polling directory mtimes every `watch_interval` seconds and
+        rescan only directories that changed, appending new images in arrival (mtime) order once their
+        size and mtime are unchanged across one poll, i.e. they are no longer being written. Paths added to
+        `requeue` (e.g. images that could not be read yet) go through the same check and are queued again.
+    """
+    dir_mtimes = {}
+    known = set()
+    pending = {}
+
+    def push(paths):
+        with discovery:
+            items.extend(paths)
+            discovery.notify_all()
+
+    def scan(path, stream, subdirs):
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.startswith('.') or entry.path in known:
+                    continue
+                if entry.is_dir():
+                    # Known subdirectories are polled on their own...
+                    if entry.path not in dir_mtimes and entry.path not in ignore_dirs:
+                        subdirs.append(entry.path)
+                    continue
+                image_name, dot, extension = entry.name.rpartition('.')
+                if not dot or f".{extension.lower()}" not in supported_formats:
+                    continue
+                known.add(entry.path)
+                if image_name in existing_labels_dict:
+                    continue
+                if stream:
+                    push([entry.path])
+                else:
+                    try:
+                        stat = entry.stat()
+                        pending[entry.path] = (stat.st_size, stat.st_mtime_ns)
+                    except OSError:
+                        known.discard(entry.path)
+
+    def walk(root, stream):
+        dirs = [root]
+        while dirs:
+            path = dirs.pop()
+            subdirs = []
+            try:
+                # Record mtime before scanning so files landing mid-scan are picked up on next poll...
+                dir_mtimes[path] = os.stat(path).st_mtime_ns
+                scan(path, stream, subdirs)
+            except OSError as e:
+                # Directory changed or vanished mid-scan (e.g. stale NFS handle), retried on next poll...
+                if path in dir_mtimes:
+                    dir_mtimes[path] = -1
+                logger.warning(f"Unable to scan directory: {e}")
+            # Depth first, in directory listing order...
+            dirs.extend(reversed(subdirs))
+
+    def poll():
+        # Only queue files left untouched since last poll, capture rigs may still be writing the others...
+        settled = []
+        while requeue:
+            path = requeue.pop()
+            pending[path] = None
+        for path, signature in list(pending.items()):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                pending.pop(path, None)
+                known.discard(path)
+                continue
+            if (stat.st_size, stat.st_mtime_ns) == signature:
+                pending.pop(path)
+                settled.append((stat.st_mtime_ns, path))
+            else:
+                pending[path] = (stat.st_size, stat.st_mtime_ns)
+        for path, mtime in list(dir_mtimes.items()):
+            try:
+                changed = os.stat(path).st_mtime_ns != mtime
+            except OSError:
+                dir_mtimes.pop(path, None)
+                continue
+            if changed:
+                walk(path, stream=False)
+        if settled:
+            push([path for _, path in sorted(settled)])
+
+    try:
+        walk(images_path, stream=True)
+    finally:
+        with discovery:
+            done.set()
+            discovery.notify_all()
+    while watch_interval:
+        time.sleep(watch_interval)
+        try:
+            poll()
+        except Exception as e:
+            logger.exception(f"Unable to check for new images, retrying in {watch_interval} seconds: {e}")
+
+def _load_json_line(line: str) -> typing.Any:
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+def load_predictions(predictions_path: str, classes: typing.Dict) -> typing.Dict:
+    """
+        Index model predictions by image name (without extension) -> (label, confidence).
+        Only the label and confidence are kept per image.
+
+        CSV: header with [image_name or image, class, confidence] columns.
+        JSONL: one {image_name, class, confidence} record per line.
+        JSON: list of {image_name, class, confidence} records, or a dict of records keyed by image.
+
+        CSV and JSONL are read one row at a time, so files with millions of rows stay cheap to load.
+        JSON is parsed as a whole, use CSV or JSONL for large prediction sets.
+    """
+    predictions = {}
+    # Predicted class can be given by label key or by human readable class name...
+    class_lookup = {str(key): key for key in classes} if classes else {}
+    class_lookup.update({str(value).lower(): key for key, value in classes.items()} if classes else {})
+    file_format = os.path.splitext(predictions_path)[-1].lower()
+    with open(predictions_path, newline='') as f:
+        if file_format == '.csv':
+            records = csv.DictReader(f)
+        elif file_format == '.jsonl':
+            # Malformed lines (e.g. a partly written last line) are skipped...
+            records = (_load_json_line(line) for line in f if line.strip())
+        elif file_format == '.json':
+            records = json.load(f)
+            records = records.values() if isinstance(records, dict) else records
+        else:
+            logger.warning(f"Unsupported predictions format [{file_format}]. Supported formats are [csv, jsonl, json].")
+            return predictions
+        skipped = 0
+        for record in records:
+            if not isinstance(record, dict):
+                skipped += 1
+                continue
+            image_name = record.get('image_name', record.get('image', ''))
+            klass = str(record.get('class', '')).strip()
+            if class_lookup:
+                label = class_lookup.get(klass.lower())
+            else:
+                label = int(klass) if klass.isdigit() and int(klass) < 10 else None
+            try:
+                confidence = float(record.get('confidence', 0))
+            except (TypeError, ValueError):
+                confidence = math.nan
+            if not math.isfinite(confidence):
+                label = None
+            if not image_name or label is None:
+                skipped += 1
+                continue
+            predictions[os.path.splitext(os.path.basename(image_name))[0]] = (label, confidence)
+    if skipped:
+        logger.warning(f"Skipped {skipped} prediction(s) with malformed record, missing image name, unknown class, or invalid confidence.")
+    return predictions
+
+def transfer_item(previous_path: str, image_path: str, dist_folder: str, command: typing.Callable) -> str:
+    """
+        Copy/move a single labeled image into `dist_folder` and return its new path. If the image was already
+        transferred to `previous_path` (i.e. it was relabeled), the earlier move/copy is redone for the new class.
+    """
+    dist_path = Path(dist_folder)
+    dist_path.mkdir(parents=True, exist_ok=True)
+    new_path = os.path.join(dist_path, image_path.split(os.sep)[-1])
+    if previous_path == new_path:
+        return new_path
+    if previous_path and command == shutil.move:
+        # Image no longer lives in the source directory...
+        image_path = previous_path
+    elif previous_path and os.path.isfile(previous_path):
+        os.remove(previous_path)
+    command(image_path, new_path)
+    return new_path
+
 def annotate(images_path: str, output_name: str, classes: typing.Any, data_transfer: str,
              dst_folder: str, window_size: int, monitor_dims: tuple, show_class_names: bool=True,
-             loop: bool=True, measure: bool=False, save_overlay: bool=False):
+             loop: bool=True, measure: bool=False, save_overlay: bool=False, predictions_path: str=None,
+             accept_threshold: float=None, verify_rate: float=0.1, watch: bool=False, poll_interval: float=2.0,
+             transfer_now: bool=False):
     """
         https://docs.opencv.org/4.x/d4/da8/group__imgcodecs.html
 
@@ -175,6 +394,14 @@ def annotate(images_path: str, output_name: str, classes: typing.Any, data_trans
         OpenEXR Image files - *.exr (see the Note section)
         Radiance HDR - .hdr, .pic (always supported)
 
+        Predictions (optional) - when `predictions_path` is given, items are queued by ascending confidence
+        and the predicted class is shown in the description area. ENTER accepts the prediction and a NumPad
+        key overrides it. Items with confidence >= `accept_threshold` are accepted in bulk, except for a
+        random `verify_rate` fraction that is kept in the queue for manual verification.
+
+        Watch (optional) - when `watch` is set, the session stays open and images landing in `images_path`
+        are queued in arrival order, polling every `poll_interval` seconds. With `transfer_now`, each labeled
+        image is copied/moved to its class folder right away instead of in one batch at exit.
     """
     if measure:
         # Set up the listener for Ctrl + Z
@@ -204,50 +431,163 @@ def annotate(images_path: str, output_name: str, classes: typing.Any, data_trans
         tooltip_strings = [tooltip_string]
     if len(tooltip_strings) > 3:
         logger.warning("You have very long class names, this is not recommened. Tooltip will look confusing.")
-    supported_formats = ['.bmp', '.dib', '.jpg', '.jpeg', '.jpe', '.jp2', '.png', '.webp', '.pmb', '.pmg',
-                         '.ppm', '.pxm', '.pnm', '.pfm', '.sr', '.ras', '.tiff', '.tif', '.exr', '.hdr', '.pic']
+    supported_formats = {'.bmp', '.dib', '.jpg', '.jpeg', '.jpe', '.jp2', '.png', '.webp', '.pmb', '.pmg',
+                         '.ppm', '.pxm', '.pnm', '.pfm', '.sr', '.ras', '.tiff', '.tif', '.exr', '.hdr', '.pic'}
     font = cv2.FONT_HERSHEY_SIMPLEX
     fontScale = 0.8
     fontColor = (0,100,0)
     thickness = 2
     lineType = 1
     existing_labels_dict = load_existing_labels(output_name)
-    items = glob.glob(os.path.join(images_path, "**"), recursive=True)
-    # Filter items based on existing labeled images and supported formats...
-    items = [item for item in items if os.path.splitext(item.split(os.sep)[-1])[0] not in existing_labels_dict and \
-             os.path.splitext(item.split(os.sep)[-1])[1].lower() in supported_formats]
-    if not items:
-        logger.warning("No items to label. If you wish to relabel, then delete the labels file in path. Early termination")
-        return
+    if data_transfer == 'mv':
+        # Moving images from source directory to destination directory
+        command = shutil.move
+    else:
+        # Copying images from source directory to destination directory
+        command = shutil.copyfile
+    transfer_now = transfer_now and data_transfer in ['mv', 'cp'] and not save_overlay
+    transferred = {}
+    pending_transfers = set()
+    ignore_dirs = {os.path.realpath(dst_folder)} if dst_folder else set()
+
+    def transfer_labeled(image_path, klass):
+        # A failed transfer must not end the session, the item is left for the transfer at exit...
+        try:
+            transferred[image_path] = transfer_item(transferred.get(image_path), image_path,
+                                                    os.path.join(dst_folder, str(klass)), command)
+            pending_transfers.discard(image_path)
+        except OSError as e:
+            pending_transfers.add(image_path)
+            logger.warning(f"Unable to transfer [{image_path}], will retry after labeling is complete: {e}")
+    # Discover items in the background, labeling starts as soon as the first item is found...
+    items = []
+    requeue = []
+    read_failures = {}
+    discovery = threading.Condition()
+    discovery_done = threading.Event()
+    threading.Thread(target=discover_items, args=(images_path, supported_formats, existing_labels_dict,
+                                                  items, discovery, discovery_done, poll_interval if watch else None,
+                                                  ignore_dirs, requeue), daemon=True).start()
+    predictions = load_predictions(predictions_path, classes) if predictions_path else {}
+    reviews = bool(predictions) or any('review' in value for value in existing_labels_dict.values())
+    accepted_dict = {}
+    # Wait for the first item, or for all items since sorting by confidence needs the complete list...
+    while not (discovery_done.is_set() or (items and not predictions)):
+        title = f"SEARCHING FOR IMAGES ({len(items)} FOUND)... CLICK ESACPE TO TERMINATE"
+        if show_message(title, 100) in [27, ord('q')]:
+            cv2.destroyAllWindows()
+            return
+    if predictions:
+        predicted = lambda item: os.path.splitext(item.split(os.sep)[-1])[0] in predictions
+        confidence = lambda item: predictions[os.path.splitext(item.split(os.sep)[-1])[0]][1]
+        # Least confident predictions first, items without predictions last...
+        # Update in place, the watcher keeps appending to the same list...
+        with discovery:
+            items[:] = sorted(filter(predicted, items), key=confidence) + [item for item in items if not predicted(item)]
+        if accept_threshold is not None:
+            queue = []
+            for item in list(items):
+                full_image_name = item.split(os.sep)[-1]
+                prediction = predictions.get(os.path.splitext(full_image_name)[0])
+                if prediction and prediction[1] >= accept_threshold and random.random() >= verify_rate:
+                    label = prediction[0]
+                    klass = classes[label] if classes else label
+                    accepted_dict[item] = {"image_name": full_image_name, "label": str(label), "class": str(klass),
+                                           "prediction": str(label), "confidence": str(prediction[1]),
+                                           "review": "auto-accepted"}
+                else:
+                    queue.append(item)
+            with discovery:
+                items[:] = queue + items[len(queue) + len(accepted_dict):]
+            logger.info(f"Accepted {len(accepted_dict)} prediction(s) with confidence >= {accept_threshold}, "
+                        f"{len(items)} item(s) left to review.")
+            if accepted_dict:
+                tmp = {}
+                tmp.update(existing_labels_dict)
+                tmp.update(accepted_dict)
+                write_results(output_name, tmp, reviews=reviews)
+                if transfer_now:
+                    for item, value in accepted_dict.items():
+                        transfer_labeled(item, value['class'])
+    if not items and not watch:
+        if not accepted_dict:
+            logger.warning("No items to label. If you wish to relabel, then delete the labels file in path. Early termination")
+            return
+        logger.info("All items were auto-accepted, no items left to review.")
     key = -1000 if measure else 0 # When drawing lines we only wanna callBack onetime...
     forward = 0
     labels_dict = {}
     num_items   = len(items)
+    is_discovered = lambda: discovery_done.is_set() and num_items == len(items)
     class_keys = [k + 48 for k in classes.keys()]
     # Description area size...
     dsize = int(50 * (75 + 25 * len(tooltip_strings)) / 90) if show_class_names else 40
-    while forward < num_items:
+    while watch or forward < num_items or not is_discovered():
+        if forward >= num_items:
+            # Caught up with discovery, wait for more items while keeping the window responsive...
+            num_items = len(items)
+            if forward >= num_items and (watch or not discovery_done.is_set()):
+                status = "WAITING FOR NEW IMAGES" if discovery_done.is_set() else "SEARCHING FOR IMAGES"
+                wait_key = show_message(f"{status}... CLICK ESACPE TO TERMINATE LABELING SESSION", 100)
+                if wait_key in [27, ord('q')]:
+                    break
+                # down or left, go back to relabel while waiting...
+                if wait_key in [2621440, 2424832] and num_items:
+                    forward = num_items - 1
+                continue
+            if forward >= num_items:
+                if loop:
+                    forward = 0
+                    continue
+                break
+        num_items = len(items)
         # Reinitialize annoated_image, otherwise it'll copy from previous...
         annotated_img = None
         image_path = items[forward]
-        image = cv2.imread(image_path, cv2.IMREAD_UNCHANGED)
+        image = cv2.imread(transferred.get(image_path, image_path) if data_transfer == 'mv' else image_path,
+                           cv2.IMREAD_UNCHANGED)
+        if image is None:
+            with discovery:
+                items.pop(forward)
+            read_failures[image_path] = read_failures.get(image_path, 0) + 1
+            if watch and read_failures[image_path] < 3:
+                # Might still be written, hand it back to the watcher to queue again once settled...
+                logger.warning(f"Unable to read [{image_path}], it will be queued again once readable.")
+                requeue.append(image_path)
+            else:
+                logger.warning(f"Unable to read [{image_path}], skipping it.")
+            num_items = len(items)
+            continue
         path_list = image_path.split(os.sep)
         full_image_name = path_list[-1]
-        description_area = image[:dsize, :]
-        description_area[:,:, 0] = 245
-        description_area[:,:, 1] = 245
-        description_area[:,:, 2] = 245
+        y_start = int(window_size[1]/360 * 15) # Smallest supported y-size is 360...
+        y_end = int(y_start * 35/15) # Smallest supported y-size is 360...
+        y_pred = int(y_start * 55/15)
+        prediction = predictions.get(os.path.splitext(full_image_name)[0])
+        if prediction:
+            # Extend the description area to fit the prediction line once resized to window size...
+            strip = y_pred + y_start // 2
+            strip = max(dsize, int(np.ceil(strip * image.shape[0] / (window_size[1] - strip))))
+            description_area = np.full((strip,) + image.shape[1:], 245, dtype=image.dtype)
+        else:
+            description_area = image[:dsize, :]
+            description_area[:,:, 0] = 245
+            description_area[:,:, 1] = 245
+            description_area[:,:, 2] = 245
         if window_size[1] < 768:
             line_width = 1
 
-        y_start = int(window_size[1]/360 * 15) # Smallest supported y-size is 360...
-        y_end = int(y_start * 35/15) # Smallest supported y-size is 360...
         stacked_img = np.vstack((description_area, image))
         resized_image = resize_img(stacked_img, window_size)
-        text = f"CURRENT ITEM: {forward + 1} | OUT OF {num_items} || CLICK ESACPE TO TERMINATE LABELING SESSION"
+        found = f"{num_items}+ (WATCHING)" if watch else num_items if discovery_done.is_set() else f"{num_items}+ (SEARCHING)"
+        text = f"CURRENT ITEM: {forward + 1} | OUT OF {found} || CLICK ESACPE TO TERMINATE LABELING SESSION"
         overlay_text(resized_image, text, (7, y_start), (0, 0, 180))
         text = "NEXT: RIGHT/UP ARROW | PREVIOUS: LEFT/DOWN ARROW"
         overlay_text(resized_image, text, (7, y_end), (0, 180, 0))
+        if prediction:
+            klass = classes[prediction[0]] if classes else prediction[0]
+            text = f"PREDICTION: {str(klass).upper()} ({prediction[1]:.2f}) | ACCEPT: ENTER | CORRECT: NUMPAD"
+            overlay_text(resized_image, text, (7, y_pred), (180, 0, 0))
         redrawn_img = np.copy(resized_image)
         x_scaling, y_scaling = stacked_img.shape[1]/window_size[0], stacked_img.shape[0]/window_size[1]
 
@@ -288,6 +628,9 @@ def annotate(images_path: str, output_name: str, classes: typing.Any, data_trans
         elif key in class_keys:
             label = key - 48
             forward += 1
+        elif key == 13 and prediction: # Accept prediction...
+            label = prediction[0]
+            forward += 1
         elif key == 26 and measure: # Update image after undo ctrl+z...
             if lines:
                 lines.pop()
@@ -295,13 +638,16 @@ def annotate(images_path: str, output_name: str, classes: typing.Any, data_trans
             continue
         else:
             logger.warning(f"Invalid keystroke.")
-        if loop:
-            forward = forward % num_items
+        if loop and discovery_done.is_set() and not watch:
+            forward = forward % len(items)
         cv2.destroyAllWindows()
 
         if label > -1:
             klass = classes[label] if classes else label
             labels_dict[image_path] = {"image_name": full_image_name, "label": str(label), "class": str(klass)}
+            if prediction:
+                labels_dict[image_path].update({"prediction": str(prediction[0]), "confidence": str(prediction[1]),
+                                                "review": "accepted" if label == prediction[0] else "corrected"})
             if measure:
                 labels_dict[image_path]['measurements'] = {}
                 for i, line in enumerate(lines):
@@ -315,12 +661,16 @@ def annotate(images_path: str, output_name: str, classes: typing.Any, data_trans
                 dist_path.mkdir(parents=True, exist_ok=True)
                 cv2.imwrite(os.path.join(dist_path, image_name), annotated_img)
             logger.info(f" Labeled: {len(labels_dict)} out of {num_items} | {labels_dict[image_path]}")
-            # Cache labeled data...
-            tmp = {}
-            tmp.update(existing_labels_dict)
-            tmp.update(labels_dict)
-            write_results(output_name, tmp)
-        if len(labels_dict) == num_items:
+            # Cache labeled data, appending only the new label when possible...
+            if not append_result(output_name, labels_dict[image_path]):
+                tmp = {}
+                tmp.update(existing_labels_dict)
+                tmp.update(accepted_dict)
+                tmp.update(labels_dict)
+                write_results(output_name, tmp, reviews=reviews)
+            if transfer_now:
+                transfer_labeled(image_path, klass)
+        if len(labels_dict) == num_items and is_discovered() and not watch:
             message = np.ones((50, 900, 3))
             title = "THANK YOU! Labeling is complete, program will exit shortly..."
             cv2.putText(message, title, (7, 25), font, fontScale, fontColor, thickness, lineType)
@@ -330,24 +680,22 @@ def annotate(images_path: str, output_name: str, classes: typing.Any, data_trans
             break
 
     cv2.destroyAllWindows()
-    new_labeled_data = labels_dict.copy()
+    new_labeled_data = accepted_dict.copy()
+    new_labeled_data.update(labels_dict)
     if new_labeled_data:
         logger.info("Writing data to file...")
+        labels_dict.update(accepted_dict)
         labels_dict.update(existing_labels_dict)
-        write_results(output_name, labels_dict)
+        write_results(output_name, labels_dict, reviews=reviews)
+    # Items already transferred while labeling...
+    new_labeled_data = {key: value for key, value in new_labeled_data.items()
+                        if key not in transferred or key in pending_transfers}
     if data_transfer in ['mv', 'cp'] and new_labeled_data and not save_overlay:
         if not os.path.isdir(dst_folder):
             _dst_folder = Path(dst_folder)
             _dst_folder.mkdir(parents=True, exist_ok=True)
 
         logger.info(f"Data/images will be transfered to: {dst_folder}")
-        if data_transfer == 'mv':
-            # Moving images from source directory to destination directory
-            command = shutil.move
-        else:
-            # Copying images from source directory to destination directory
-            command = shutil.copyfile
-
         @parallel_call
         def transfer_data(**kwargs):
             image_path = kwargs.get('data', {}).get('image_path', '')
@@ -359,7 +707,8 @@ def annotate(images_path: str, output_name: str, classes: typing.Any, data_trans
         paths = []
         class_labels = []
         for key, value in new_labeled_data.items():
-            paths.append(key)
+            # Relabeled items that failed to transfer may have already been moved once...
+            paths.append(transferred.get(key, key) if command == shutil.move else key)
             class_labels.append(value.get('class', ''))
         action = 'Moving' if command == shutil.move else 'Copying'
         logger.info(f"{action} data from source directory to destination directory...")
@@ -156,11 +156,33 @@ class NotRequiredIf(click.Option):
                                         help="(optional) Flag to stop looping over the dataset. " \
                                              "By default user can navigate forward and backward, "
                                              "e.g. start from left to right or right to left.")
+@click.option('--predictions-path', '-p', type=FILE_TYPE,
+                                        help="(optional) Model predictions file [csv, jsonl, json] with image name, class, and confidence " \
+                                             "per row. Items are queued by confidence and the predicted class is shown, " \
+                                             "ENTER accepts the prediction and a NumPad key overrides it.")
+@click.option('--accept-threshold', '-a', type=click.FloatRange(0, 1),
+                                        cls=RequiredIf,
+                                        required_if='predictions_path',
+                                        help="(optional) Accept predictions with confidence >= threshold in bulk without review.")
+@click.option('--verify-rate',  '-r',   type=click.FloatRange(0, 1),
+                                        default=0.1,
+                                        show_default=True,
+                                        help="(optional) Fraction of bulk accepted predictions kept in the queue for manual verification.")
+@click.option('--watch',        '-f',   is_flag=True,
+                                        help="(optional) Keep the labeling session open and label new images as they land in the images directory.")
+@click.option('--poll-interval','-e',   type=click.FloatRange(0.1),
+                                        default=2.0,
+                                        show_default=True,
+                                        help="(optional) Seconds between checks for new images in watch mode.")
+@click.option('--transfer-now', '-y',   is_flag=True,
+                                        help="(optional) Copy/move each image to its class folder right after labeling it " \
+                                             "instead of after completing labeling.")
 @click.option('--show-usage',   '-u',   is_flag=True,
                                         help="(optional) Show detailed usage of the tool with examples and exit.")
 def cli(images_path: str, output_name: str, labels_path: str, data_transfer: bool,
         dst_folder, window_size, hide_labels, measure, save_overlay,
-        no_loop: str, show_usage: bool, *args: typing.Any, **kwargs: typing.Any) -> None:
+        no_loop: str, predictions_path: str, accept_threshold: float, verify_rate: float,
+        watch: bool, poll_interval: float, transfer_now: bool, show_usage: bool, *args: typing.Any, **kwargs: typing.Any) -> None:
     if show_usage:
         print(
         """
@@ -181,6 +203,12 @@ To use this tool you need to provide:
   choose from the preset resolutions.
 - If you wish to overlay measurements in pixels on top of image, you can provide the `measure` flag.
 - If you wish to save overlayed measurements, then you can provide the `save-overlay` flag. Note this only saves to a json format.
+- If you already have model predictions, you can provide them through the `predictions-path` option as a [csv, jsonl, json]
+  file with (image_name, class, confidence) per image. For large prediction sets use csv or jsonl, which are read
+  row by row, as json files are loaded as a whole. Images are shown from least to most confident prediction and
+  the predicted class is displayed, click on ENTER to accept the prediction or a NumPad key to correct it.
+  You can also provide `accept-threshold` to accept confident predictions in bulk, where a `verify-rate` fraction of
+  them is still shown for verification. Each record will state whether the prediction was accepted or corrected.
 - By default the tool will display the class names along with their human readable labels if
   you provide a labels.yaml file. This file contains classes and human readable labels in
   the following format: (you can download this example from: https://github.com/mhamdan91/moevat/blob/main/labels.yml)
@@ -231,6 +259,15 @@ To use this tool you need to provide:
   session, simply click on ESCAPE.
 - If you wish to resume labeling from where you stopped last time, simply provide the labels file which
   you used in the previous session and the tool will only show images that have not been labeled yet.
+- Images are discovered in the background, so labeling starts as soon as the first image is found and the
+  total count keeps updating while the images directory is being searched. When predictions are provided,
+  labeling starts once the search completes since images are ordered by confidence.
+- If images keep landing in the images directory, you can provide the `watch` flag to keep the labeling session
+  open, new images are queued in arrival order once they are fully written, checking every `poll-interval`
+  seconds. Only directories that changed are searched again. With the `transfer-now` flag each labeled image
+  is copied/moved to its class folder right away instead of after completing labeling.
+- Labels are cached as you go, each new label is appended to csv labels files while json labels files are
+  rewritten on every label, so prefer csv for large labeling sessions.
 
 Example use (in a terminal run the following command):
 > moevat -i <images_dir> -o <output_file_path.csv> -t <cp_or_mv> -d <destination_folder> -l <path_to_labels.yml>
@@ -239,6 +276,8 @@ Example use (in a terminal run the following command):
         """)
         return
     window_size = _parse_winsize(window_size)
+    if transfer_now and data_transfer not in ['cp', 'mv']:
+        logger.warning("`transfer-now` requires `data-transfer` to be [cp] or [mv], images will not be transferred.")
     logger.info("MAKE SURE NumLock is ON...")
     loop = False if no_loop else True
     show_class_names = False if hide_labels else True
@@ -267,7 +306,8 @@ Example use (in a terminal run the following command):
     logger.info(f"Labeled data will be saved to: {os.path.abspath(output_name)}")
     monitor_dims = _get_monitor_dims()
     annotate(images_path, output_name, classes, data_transfer, dst_folder,
-             window_size, monitor_dims, show_class_names, loop, measure, save_overlay)
+             window_size, monitor_dims, show_class_names, loop, measure, save_overlay, predictions_path,
+             accept_threshold, verify_rate, watch, poll_interval, transfer_now)
 
 def main() -> None:
     cli(prog_name='moevat')